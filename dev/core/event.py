@@ -2,14 +2,14 @@
 
 from dataclasses import dataclass, field
 from typing import Optional, List
-from uuid import uuid4
+from dev.core.identity import content_id
 
 @dataclass
 class Event:
     name: str
     start_year: int
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: Optional[str] = None
     end_year: Optional[int] = None
     description: str = ""
     scope: str = "local"  # "local", "major", "global"
@@ -17,6 +17,25 @@ class Event:
     region: Optional[str] = None
     related_to: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Ids derived from content follow later edits to the fields they hash;
+        # an id passed in explicitly is kept as is.
+        object.__setattr__(self, "_derived_id", self.id is None)
+        if self.id is None:
+            object.__setattr__(self, "id", self._content_id())
+
+    def __setattr__(self, key, value):
+        if key == "id" and hasattr(self, "_derived_id"):
+            object.__setattr__(self, "_derived_id", value is None)
+            if value is None:
+                value = self._content_id()
+        super().__setattr__(key, value)
+        if key in ("name", "start_year", "end_year") and getattr(self, "_derived_id", False):
+            super().__setattr__("id", self._content_id())
+
+    def _content_id(self) -> str:
+        return content_id("event", self.name, self.start_year, self.end_year)
+
     @classmethod
     def from_dict(cls, data: dict):
         if "name" not in data:
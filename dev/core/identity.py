@@ -0,0 +1,22 @@
+# core/identity.py
+
+import unicodedata
+from typing import Optional, Union
+from uuid import NAMESPACE_URL, uuid5
+
+# Fixed namespace so the same record always hashes to the same id.
+TIMELINE_NAMESPACE = uuid5(NAMESPACE_URL, "timeline_gpt")
+
+
+def normalize_text(value: Optional[Union[int, str]]) -> str:
+    """ Case-fold, unicode-normalize and collapse whitespace for hashing """
+    if value is None:
+        return ""
+    text = unicodedata.normalize("NFKC", str(value))
+    return " ".join(text.casefold().split())
+
+
+def content_id(kind: str, name: str, *dates: Optional[Union[int, str]]) -> str:
+    """ Stable id derived from the record kind, its name and its dates """
+    key = "|".join([kind, normalize_text(name)] + [normalize_text(d) for d in dates])
+    return str(uuid5(TIMELINE_NAMESPACE, key))
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Union, Tuple
-from uuid import uuid4
+from dev.core.identity import content_id
 
 @dataclass
 class Influence:
@@ -16,7 +16,7 @@ class Person:
     start: Union[int, str]
     end: Union[int, str]
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: Optional[str] = None
     start_is_approx: bool = False
     influences: List[Influence] = field(default_factory=list)
     summary: str = ""
@@ -27,6 +27,24 @@ class Person:
     quotes: List[str] = field(default_factory=list)
     sources: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Ids derived from content follow later edits to the fields they hash;
+        # an id passed in explicitly is kept as is.
+        object.__setattr__(self, "_derived_id", self.id is None)
+        if self.id is None:
+            object.__setattr__(self, "id", self._content_id())
+
+    def __setattr__(self, key, value):
+        if key == "id" and hasattr(self, "_derived_id"):
+            object.__setattr__(self, "_derived_id", value is None)
+            if value is None:
+                value = self._content_id()
+        super().__setattr__(key, value)
+        if key in ("name", "start", "end") and getattr(self, "_derived_id", False):
+            super().__setattr__("id", self._content_id())
+
+    def _content_id(self) -> str:
+        return content_id("person", self.name, self.start, self.end)
 
     @classmethod
     def from_dict(cls, data: dict):
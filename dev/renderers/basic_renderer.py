@@ -4,24 +4,49 @@ import matplotlib.pyplot as plt
 import matplotlib.image as mpimg
 import os
 
+from dev.renderers.label_layout import LabelRequest, place_labels
+
+SCOPE_PRIORITY = {"global": 3, "major": 2, "local": 1}
+
 class BasicRenderer:
-    def __init__(self, config, theme_name="light"):
+    def __init__(self, config, theme_name="light", min_label_px=6.0):
         self.theme = config["THEMES"][theme_name]
         self.school_colors = config.get("SCHOOL_COLORS", {})
+        self.min_label_px = min_label_px
+        self.box_height = 0.8
+        self.box_padding = 0.5
 
     def render(self, persons, events, output_path="timeline.png"):
-        import matplotlib.pyplot as plt
-        from matplotlib.patches import Rectangle, FancyArrowPatch
-        from matplotlib.offsetbox import OffsetImage, AnnotationBbox
-        import os
-
         fig, ax = plt.subplots(figsize=(16, 8))
+        self.apply_theme(fig, ax)
+
+        labels = []  # (text, x, y, options) in data coords, placed once limits are known
+        spans = [(person,) + self.person_span(person, i) for i, person in enumerate(persons)]
+        name_to_coords = self.draw_persons(ax, spans, labels)
+        self.draw_influences(ax, persons, name_to_coords)
 
-        # === Apply theme colors ===
+        y_event = len(persons) * (self.box_height + self.box_padding) + 1
+        self.draw_events(ax, events, y_event, labels)
+
+        # === Set axis limits dynamically based on all years ===
+        all_years = [year for coords in name_to_coords.values() for year in coords[:2]]
+        all_years += [year for event in events for year in (event.start_year, event.end_year) if year]
+        if all_years:
+            ax.set_xlim(min(all_years) - 10, max(all_years) + 10)
+        ax.set_ylim(-1, y_event + self.event_headroom(y_event))
+        ax.set_yticks([])
+
+        self.finish_figure(fig, ax, labels)
+        plt.savefig(output_path)
+        plt.close()
+
+    def event_headroom(self, y_event):
+        """ Space above the event line for rotated event names; grows with the lane count """
+        return max(2, 0.25 * y_event)
+
+    def apply_theme(self, fig, ax):
         bg = self.theme["background"]
         fg = self.theme["text_color"]
-        grid = self.theme["grid_color"]
-        event_colors = self.theme["event_colors"]
 
         fig.patch.set_facecolor(bg)
         ax.set_facecolor(bg)
@@ -29,23 +54,30 @@ class BasicRenderer:
         ax.xaxis.label.set_color(fg)
         ax.yaxis.label.set_color(fg)
         ax.title.set_color(fg)
-        ax.grid(True, axis='x', linestyle='--', alpha=0.5, color=grid)
-
-        box_height = 0.8
-        box_padding = 0.5
+        ax.grid(True, axis='x', linestyle='--', alpha=0.5, color=self.theme["grid_color"])
+
+    def person_span(self, person, index):
+        """ (start, end, is_ghost); ghosts get a placeholder span based on their index """
+        start = person.parsed_start()
+        end = person.parsed_end()
+        if start is None or end is None:
+            start = 1900 + index * 10
+            return start, start + 5, True
+        return start, end, False
+
+    def draw_persons(self, ax, spans, labels, window=None):
+        """
+        Draw one lane per (person, start, end, is_ghost) entry and return
+        name -> (start, end, y). With a (lo, hi) window, labels are centred
+        on the part of each box inside it.
+        """
+        fg = self.theme["text_color"]
         name_to_coords = {}
-        all_years = []
 
-        # === Draw person boxes ===
-        for i, person in enumerate(persons):
-            start = person.parsed_start()
-            end = person.parsed_end()
-            y = i * (box_height + box_padding)
+        for i, (person, start, end, is_ghost) in enumerate(spans):
+            y = i * (self.box_height + self.box_padding)
 
-            is_ghost = start is None or end is None
             if is_ghost:
-                start = 1900 + i * 10
-                end = start + 5
                 label = f"{person.name}\n(context only)"
                 fill_color = "#999999"
                 linestyle = (0, (4, 2))  # dashed
@@ -54,23 +86,26 @@ class BasicRenderer:
                 fill_color = self.school_colors.get(person.school_of_thought, "black")
                 linestyle = "solid"
 
-            edge_color = fg
-            all_years.extend([start, end])
             width = end - start
-
-            rect = Rectangle((start, y), width, box_height,
+            rect = Rectangle((start, y), width, self.box_height,
                             facecolor=fill_color,
-                            edgecolor=edge_color,
+                            edgecolor=fg,
                             linewidth=1.5,
                             linestyle=linestyle)
             ax.add_patch(rect)
 
-            ax.text(start + width / 2, y + box_height / 2, label,
-                    ha='center', va='center', fontsize=8, color='white')
+            label_start, label_end = (start, end) if window is None else \
+                (max(start, window[0]), min(end, window[1]))
+            label_width = label_end - label_start
+            labels.append((label, label_start + label_width / 2, y + self.box_height / 2,
+                           dict(fontsize=8, color='white', priority=0 if is_ghost else label_width,
+                                box=(label_start, y, label_end, y + self.box_height))))
 
-            name_to_coords[person.name] = (start, end, y + box_height / 2)
+            name_to_coords[person.name] = (start, end, y + self.box_height / 2)
 
-        # === Influence arrows ===
+        return name_to_coords
+
+    def draw_influences(self, ax, persons, name_to_coords):
         for person in persons:
             src_coords = name_to_coords.get(person.name)
             if not src_coords:
@@ -87,49 +122,36 @@ class BasicRenderer:
                                         arrowstyle="->", color='gray', lw=1.8)
                 ax.add_patch(arrow)
 
-        # === Events ===
-        y_event = len(persons) * (box_height + box_padding) + 1
+    def draw_events(self, ax, events, y_event, labels):
+        fg = self.theme["text_color"]
+        event_colors = self.theme["event_colors"]
+
         for event in events:
             color = event_colors.get(event.scope, "black")
             s = event.start_year
             e = event.end_year
-            all_years.append(s)
             if e:
-                all_years.append(e)
                 ax.axvspan(s, e, color=color, alpha=0.2)
-                ax.text((s + e) / 2, y_event, event.name, ha='center', va='bottom', fontsize=7, rotation=90, color=fg)
+                label_x = (s + e) / 2
             else:
                 ax.axvline(s, linestyle=':', color=color, alpha=0.7)
-                ax.text(s, y_event, event.name, rotation=90, ha='center', va='bottom', fontsize=7, color=fg)
+                label_x = s
+            labels.append((event.name, label_x, y_event,
+                           dict(fontsize=7, color=fg, rotation=90, va='bottom',
+                                priority=SCOPE_PRIORITY.get(event.scope, 0))))
 
             # Draw icon (optional)
             if hasattr(event, "type") and event.type:
-                icon_path = f"assets/icons/{event.type}.png"
-                if os.path.exists(icon_path):
-                    try:
-                        img = mpimg.imread(icon_path)
-                        imagebox = OffsetImage(img, zoom=0.04)
-                        ab = AnnotationBbox(imagebox, (s, y_event + 0.4), frameon=False)
-                        ax.add_artist(ab)
-                    except Exception as e:
-                        print(f"⚠️ Failed to render icon {icon_path}: {e}")
-
-        # === Set axis limits dynamically based on all_years ===
-        if all_years:
-            ax.set_xlim(min(all_years) - 10, max(all_years) + 10)
-        ax.set_ylim(-1, y_event + 2)
-        ax.set_yticks([])
+                self.draw_icon(ax, s, y_event + 0.4, f"assets/icons/{event.type}.png")
 
-        # === Final layout and save ===
+    def finish_figure(self, fig, ax, labels):
         try:
-            plt.tight_layout()
+            fig.tight_layout()
         except Exception as e:
             print(f"⚠️ tight_layout() adjustment failed: {e}")
-            plt.subplots_adjust(left=0.1, right=0.9)
-
-        plt.savefig(output_path)
-        plt.close()
+            fig.subplots_adjust(left=0.1, right=0.9)
 
+        self.draw_labels(ax, labels)
 
     def draw_icon(self, ax, x, y, path, zoom=0.04):
         if not os.path.exists(path):
@@ -141,3 +163,39 @@ class BasicRenderer:
             ax.add_artist(ab)
         except Exception as e:
             print(f"⚠️ Failed to render icon {path}: {e}")
+
+    def draw_labels(self, ax, labels):
+        """ Place labels collision-free in pixel space and draw the survivors """
+        to_px = ax.transData.transform
+        requests = []
+        options_for = {}
+        for text, x, y, options in labels:
+            px, py = to_px((x, y))
+            if options.get("rotation") == 90:
+                step = options["fontsize"] * ax.figure.dpi / 72
+                offsets = [(0, 0), (-step, 0), (step, 0), (-2 * step, 0), (2 * step, 0)]
+                container = None
+            else:
+                # Person labels must fit inside their box at the output resolution
+                (x0, y0), (x1, y1) = to_px(options["box"][:2]), to_px(options["box"][2:])
+                quarter = (x1 - x0) / 4
+                offsets = [(0, 0), (-quarter, 0), (quarter, 0)]
+                container = (x0, y0, x1, y1)
+            request = LabelRequest(text, px, py, options["fontsize"],
+                                   rotation=options.get("rotation", 0),
+                                   va=options.get("va", "center"),
+                                   priority=options["priority"], offsets=offsets,
+                                   container=container)
+            requests.append(request)
+            options_for[id(request)] = options
+
+        placed = place_labels(requests, dpi=ax.figure.dpi, min_font_px=self.min_label_px,
+                              bounds=tuple(ax.bbox.extents))
+
+        to_data = ax.transData.inverted().transform
+        for label in placed:
+            options = options_for[id(label.request)]
+            x, y = to_data(label.center)
+            ax.text(x, y, label.text, ha='center', va='center',
+                    fontsize=options["fontsize"], rotation=options.get("rotation", 0),
+                    color=options["color"])
@@ -0,0 +1,138 @@
+import heapq
+import html
+import json
+import os
+from collections import defaultdict
+
+from dev.utils.config_loader import resource_path
+
+TEMPLATE_PATH = "dev/renderers/templates/html_viewer.html"
+
+
+class HtmlRenderer:
+    """
+    Writes a static, self-contained HTML viewer plus the dataset split into
+    chunk files by century and lane band. Chunks are JavaScript files that
+    hand their records to the viewer, so the directory works straight from
+    disk (file://) with no server. The viewer only loads the chunks that
+    intersect the visible window.
+    """
+
+    def __init__(self, config, theme_name="light", years_per_chunk=100, lanes_per_band=64):
+        self.theme = config["THEMES"][theme_name]
+        self.school_colors = config.get("SCHOOL_COLORS", {})
+        self.years_per_chunk = years_per_chunk
+        self.lanes_per_band = lanes_per_band
+
+    def render(self, persons, events, output_path="timeline_html", title="Timeline"):
+        data_dir = os.path.join(output_path, "data")
+        os.makedirs(data_dir, exist_ok=True)
+        # Drop chunks left over from a previous export into the same directory
+        for name in os.listdir(data_dir):
+            if name.endswith(".js") and name.startswith(("p_", "e_")):
+                os.remove(os.path.join(data_dir, name))
+
+        # Ghost persons have no dates to place them by, so they are left out
+        dated = [(p, p.parsed_start(), p.parsed_end()) for p in persons]
+        dated = [(p, s, e) for p, s, e in dated if s is not None and e is not None]
+        lanes = self.assign_lanes(dated)
+
+        # Influence targets are names; a name shared by several figures cannot
+        # be resolved to one of them, so arrows to it are dropped.
+        ids = {}
+        ambiguous = set()
+        for i, (person, _, _) in enumerate(dated):
+            if person.name in ids:
+                ambiguous.add(person.name)
+            ids[person.name] = i
+        for name in ambiguous:
+            del ids[name]
+        if ambiguous:
+            print(f"⚠️ Influence arrows to duplicate names were skipped: {', '.join(sorted(ambiguous))}")
+
+        schools = sorted({p.school_of_thought for p, _, _ in dated if p.school_of_thought})
+        school_index = {name: i for i, name in enumerate(schools)}
+
+        person_chunks = defaultdict(list)
+        for i, (person, start, end) in enumerate(dated):
+            lane = lanes[i]
+            key = (start // self.years_per_chunk, lane // self.lanes_per_band)
+            targets = [ids[inf.target] for inf in person.influences if inf.target in ids]
+            person_chunks[key].append([
+                i, person.name, start, end, lane,
+                school_index.get(person.school_of_thought, -1),
+                f"{person.start}–{person.end}", person.summary, targets,
+            ])
+
+        event_chunks = defaultdict(list)
+        for event in events:
+            key = event.start_year // self.years_per_chunk
+            event_chunks[key].append([
+                event.name, event.start_year, event.end_year, event.scope,
+                event.type, event.description,
+            ])
+
+        index = {
+            "title": title,
+            "theme": self.theme,
+            "schools": [[name, self.school_colors.get(name, "black")] for name in schools],
+            "lanes": max(lanes, default=-1) + 1,
+            "figures": len(dated),
+            "ambiguousNames": sorted(ambiguous),
+            "personChunks": [],
+            "eventChunks": [],
+        }
+
+        for (century, band), records in sorted(person_chunks.items()):
+            file = f"p_{century}_{band}.js"
+            self._write_chunk(data_dir, file, records)
+            index["personChunks"].append({
+                "file": file,
+                "x0": min(r[2] for r in records), "x1": max(r[3] for r in records),
+                "l0": min(r[4] for r in records), "l1": max(r[4] for r in records),
+                "n": len(records),
+            })
+
+        for century, records in sorted(event_chunks.items()):
+            file = f"e_{century}.js"
+            self._write_chunk(data_dir, file, records)
+            index["eventChunks"].append({
+                "file": file,
+                "x0": min(r[1] for r in records), "x1": max(r[2] or r[1] for r in records),
+                "n": len(records),
+            })
+
+        years = [c["x0"] for c in index["personChunks"] + index["eventChunks"]]
+        years += [c["x1"] for c in index["personChunks"] + index["eventChunks"]]
+        index["extent"] = [min(years), max(years)] if years else [0, 100]
+
+        with open(os.path.join(data_dir, "index.js"), "w", encoding="utf-8") as f:
+            f.write(f"timelineIndex({json.dumps(index, ensure_ascii=False)});\n")
+
+        with open(resource_path(TEMPLATE_PATH), "r", encoding="utf-8") as f:
+            page = f.read().replace("__TIMELINE_TITLE__", html.escape(title))
+        with open(os.path.join(output_path, "index.html"), "w", encoding="utf-8") as f:
+            f.write(page)
+
+    @staticmethod
+    def assign_lanes(dated):
+        """ Pack lifespans into as few lanes as possible (interval partitioning) """
+        lanes = [0] * len(dated)
+        free = []  # (end year, lane) of lanes, earliest free first
+        count = 0
+        for i in sorted(range(len(dated)), key=lambda i: dated[i][1]):
+            _, start, end = dated[i]
+            if free and free[0][0] < start:
+                _, lane = heapq.heappop(free)
+            else:
+                lane = count
+                count += 1
+            lanes[i] = lane
+            heapq.heappush(free, (end, lane))
+        return lanes
+
+    @staticmethod
+    def _write_chunk(data_dir, file, records):
+        payload = json.dumps(records, ensure_ascii=False, separators=(",", ":"))
+        with open(os.path.join(data_dir, file), "w", encoding="utf-8") as f:
+            f.write(f"timelineChunk({json.dumps(file)},{payload});\n")
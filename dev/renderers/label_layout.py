@@ -0,0 +1,151 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# Rough glyph metrics relative to the font size in pixels. Good enough to
+# predict overlaps without asking the backend to rasterize every label.
+CHAR_WIDTH = 0.6
+LINE_HEIGHT = 1.25
+ELLIPSIS = "…"
+
+Box = Tuple[float, float, float, float]  # x0, y0, x1, y1 in pixels
+
+
+@dataclass
+class LabelRequest:
+    text: str
+    x: float  # anchor in pixels
+    y: float
+    fontsize: float  # points
+    rotation: int = 0  # 0 or 90
+    va: str = "center"  # "center" or "bottom"
+    priority: float = 0.0
+    offsets: List[Tuple[float, float]] = field(default_factory=lambda: [(0.0, 0.0)])
+    min_chars: int = 6
+    container: Optional[Box] = None  # label must fit inside, e.g. its person box
+
+
+@dataclass
+class PlacedLabel:
+    request: LabelRequest
+    text: str
+    box: Box
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        x0, y0, x1, y1 = self.box
+        return (x0 + x1) / 2, (y0 + y1) / 2
+
+
+def text_extent(text: str, font_px: float) -> Tuple[float, float]:
+    """ Estimated (width, height) of unrotated text in pixels """
+    lines = text.split("\n")
+    width = max(len(line) for line in lines) * font_px * CHAR_WIDTH
+    height = len(lines) * font_px * LINE_HEIGHT
+    return width, height
+
+
+def text_variants(text: str, min_chars: int) -> List[str]:
+    """ The full text, then fewer lines, then an ever shorter first line """
+    lines = text.split("\n")
+    while len(lines) > 1 and not lines[-1].strip():
+        lines.pop()
+    variants = ["\n".join(lines[:k]) for k in range(len(lines), 0, -1)]
+
+    first = lines[0]
+    length = len(first) * 3 // 4
+    while length >= min_chars:
+        variants.append(first[:length].rstrip() + ELLIPSIS)
+        length = length * 3 // 4
+    return variants
+
+
+class GridIndex:
+    """ Uniform grid over pixel space; each cell lists the boxes touching it """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = max(cell_size, 1.0)
+        self.cells: Dict[Tuple[int, int], List[Box]] = defaultdict(list)
+
+    def _cells(self, box: Box):
+        x0, y0, x1, y1 = box
+        size = self.cell_size
+        for cx in range(int(x0 // size), int(x1 // size) + 1):
+            for cy in range(int(y0 // size), int(y1 // size) + 1):
+                yield cx, cy
+
+    def collides(self, box: Box) -> bool:
+        x0, y0, x1, y1 = box
+        for cell in self._cells(box):
+            for ox0, oy0, ox1, oy1 in self.cells.get(cell, ()):
+                if x0 < ox1 and ox0 < x1 and y0 < oy1 and oy0 < y1:
+                    return True
+        return False
+
+    def insert(self, box: Box):
+        for cell in self._cells(box):
+            self.cells[cell].append(box)
+
+
+def _label_box(request: LabelRequest, text: str, font_px: float, dx: float, dy: float) -> Box:
+    width, height = text_extent(text, font_px)
+    if request.rotation == 90:
+        width, height = height, width
+    x = request.x + dx
+    y = request.y + dy
+    y0 = y if request.va == "bottom" else y - height / 2
+    return x - width / 2, y0, x + width / 2, y0 + height
+
+
+def _inside(box: Box, outer: Box) -> bool:
+    return box[0] >= outer[0] and box[1] >= outer[1] and box[2] <= outer[2] and box[3] <= outer[3]
+
+
+def place_labels(requests: List[LabelRequest], dpi: float = 100,
+                 min_font_px: float = 6.0, padding: float = 2.0,
+                 obstacles: Optional[List[Box]] = None,
+                 bounds: Optional[Box] = None) -> List[PlacedLabel]:
+    """
+    Greedy collision-free placement, highest priority first.
+
+    Each label tries its full text at every offset, then shorter variants.
+    A placement must stay inside `bounds` (usually the axes) and inside the
+    request's own container, if it has one. Labels whose font would render
+    below min_font_px, or that collide or overflow at every offset even
+    when shortened, are culled.
+    Sorting dominates, so the whole pass is O(n log n) for bounded
+    offsets and variants.
+    """
+    scale = dpi / 72.0
+    visible = [r for r in requests if r.text and r.fontsize * scale >= min_font_px]
+    if not visible:
+        return []
+
+    sizes = sorted(r.fontsize * scale * LINE_HEIGHT * 2 for r in visible)
+    index = GridIndex(sizes[len(sizes) // 2])
+    for box in obstacles or []:
+        index.insert(box)
+
+    placed = []
+    for request in sorted(visible, key=lambda r: -r.priority):
+        font_px = request.fontsize * scale
+        result = None
+        for text in text_variants(request.text, request.min_chars):
+            for dx, dy in request.offsets:
+                box = _label_box(request, text, font_px, dx, dy)
+                if bounds is not None and not _inside(box, bounds):
+                    continue
+                if request.container is not None and not _inside(box, request.container):
+                    continue
+                padded = (box[0] - padding, box[1] - padding, box[2] + padding, box[3] + padding)
+                if not index.collides(padded):
+                    result = PlacedLabel(request, text, box)
+                    break
+            if result:
+                break
+
+        if result:
+            index.insert(result.box)
+            placed.append(result)
+
+    return placed
@@ -0,0 +1,154 @@
+from matplotlib.backends.backend_pdf import PdfPages
+import matplotlib.pyplot as plt
+from collections import defaultdict
+
+from dev.renderers.basic_renderer import BasicRenderer
+
+
+class PaginatedRenderer(BasicRenderer):
+    """
+    Splits a timeline into pages by year range or by lane count and streams
+    them into one multi-page PDF. Only the current page's figure is alive at
+    any time, so peak memory does not grow with the length of the timeline.
+    """
+
+    def __init__(self, config, theme_name="light", years_per_page=None, lanes_per_page=None,
+                 margin_years=10, figsize=(16, 8), **kwargs):
+        super().__init__(config, theme_name, **kwargs)
+        if (years_per_page is None) == (lanes_per_page is None):
+            raise ValueError("Set exactly one of 'years_per_page' or 'lanes_per_page'.")
+        self.years_per_page = years_per_page
+        self.lanes_per_page = lanes_per_page
+        self.margin_years = margin_years
+        self.figsize = figsize
+
+    def render(self, persons, events, output_path="timeline.pdf"):
+        spans = [(person,) + self.person_span(person, i) for i, person in enumerate(persons)]
+        pages = self.paginate(spans, events)
+
+        # First page each person appears on, for the continuation markers
+        page_of = {}
+        for number, (page_spans, _, _) in enumerate(pages, start=1):
+            for person, *_ in page_spans:
+                page_of.setdefault(person.name, number)
+
+        # Incoming influences, so a page only has to look at its own persons
+        sources_of = defaultdict(list)
+        for person in persons:
+            for influence in person.influences:
+                sources_of[influence.target].append(person)
+
+        with PdfPages(output_path) as pdf:
+            for number, (page_spans, page_events, window) in enumerate(pages, start=1):
+                fig = self.render_page(page_spans, page_events, window, number, len(pages),
+                                       page_of, sources_of)
+                pdf.savefig(fig, facecolor=fig.get_facecolor())
+                plt.close(fig)
+
+    def paginate(self, spans, events):
+        """
+        Return a list of (spans, events, (x_min, x_max)) per page. Empty
+        pages are dropped. x_min/x_max already include the context margin.
+        """
+        years = [year for _, start, end, _ in spans for year in (start, end)]
+        years += [year for e in events for year in (e.start_year, e.end_year) if year]
+        if not years:
+            return []
+        first, last = min(years), max(years)
+
+        if self.lanes_per_page is not None:
+            # Every page spans the full year range, so every event is on it
+            window = (first - self.margin_years, last + self.margin_years)
+            return [(spans[i:i + self.lanes_per_page], events, window)
+                    for i in range(0, max(len(spans), 1), self.lanes_per_page)]
+
+        # Bucket each record once into the pages whose window it overlaps
+        size, margin = self.years_per_page, self.margin_years
+        count = (last - first) // size + 1
+        page_spans = [[] for _ in range(count)]
+        page_events = [[] for _ in range(count)]
+
+        def overlapping(start, end):
+            # Page k covers [first + k*size - margin, first + (k+1)*size + margin]
+            lo = max(0, -((first + size + margin - start) // size))
+            hi = min(count - 1, (end - first + margin) // size)
+            return range(lo, hi + 1)
+
+        for span in sorted(spans, key=lambda s: s[1]):
+            for k in overlapping(span[1], span[2]):
+                page_spans[k].append(span)
+        for event in events:
+            for k in overlapping(event.start_year, event.end_year or event.start_year):
+                page_events[k].append(event)
+
+        pages = []
+        for k in range(count):
+            if page_spans[k] or page_events[k]:
+                lo = first + k * size - margin
+                pages.append((page_spans[k], page_events[k], (lo, lo + size + 2 * margin)))
+        return pages
+
+    def render_page(self, page_spans, page_events, window, number, total, page_of, sources_of):
+        fig, ax = plt.subplots(figsize=self.figsize)
+        self.apply_theme(fig, ax)
+
+        labels = []
+        name_to_coords = self.draw_persons(ax, page_spans, labels, window)
+        page_persons = [span[0] for span in page_spans]
+        self.draw_influences(ax, page_persons, name_to_coords)
+        self.draw_continuations(ax, page_persons, name_to_coords, window, number,
+                                page_of, sources_of)
+
+        y_event = len(page_spans) * (self.box_height + self.box_padding) + 1
+        self.draw_events(ax, page_events, y_event, labels)
+
+        lo, hi = window
+        if self.years_per_page is not None:
+            # Shade the overlap with the neighbouring pages
+            grid = self.theme["grid_color"]
+            ax.axvspan(lo, lo + self.margin_years, color=grid, alpha=0.25)
+            ax.axvspan(hi - self.margin_years, hi, color=grid, alpha=0.25)
+        ax.set_xlim(lo, hi)
+        ax.set_ylim(-1, y_event + self.event_headroom(y_event))
+        ax.set_yticks([])
+        ax.set_title(f"{lo + self.margin_years}–{hi - self.margin_years}  (page {number}/{total})"
+                     if self.years_per_page is not None else f"Page {number}/{total}")
+
+        self.finish_figure(fig, ax, labels)
+        return fig
+
+    def draw_continuations(self, ax, page_persons, name_to_coords, window, number,
+                           page_of, sources_of):
+        """ Stub arrows for influences whose other end is on a different page """
+        lo, hi = window
+        fg = self.theme["text_color"]
+
+        def clamp(x):
+            return min(max(x, lo), hi)
+
+        def stub(start, end, edge, y, text):
+            ax.annotate("", xy=end, xytext=start,
+                        arrowprops=dict(arrowstyle="->", color='gray', lw=1.2, linestyle='--'))
+            ax.text(edge, y, text, fontsize=6, color=fg, va='bottom',
+                    ha='right' if edge == hi else 'left', clip_on=True)
+
+        for person in page_persons:
+            # Outgoing: this page holds the source, the target is elsewhere
+            _, src_end, y = name_to_coords[person.name]
+            for influence in person.influences:
+                if influence.target in name_to_coords or influence.target not in page_of:
+                    continue
+                other_page = page_of[influence.target]
+                edge = hi if other_page > number else lo
+                stub((clamp(src_end), y), (edge, y), edge, y,
+                     f"→ {influence.target} (p. {other_page})")
+
+            # Incoming: this page holds the target, the source is elsewhere
+            tgt_start, _, y = name_to_coords[person.name]
+            for source in sources_of.get(person.name, ()):
+                if source.name in name_to_coords or source.name not in page_of:
+                    continue
+                other_page = page_of[source.name]
+                edge = hi if other_page > number else lo
+                stub((edge, y), (clamp(tgt_start), y), edge, y,
+                     f"{source.name} (p. {other_page}) →")
@@ -0,0 +1,183 @@
+from dev.core.person import Person
+from dev.core.event import Event
+from dev.core.identity import normalize_text
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+# Influences are diffed as their own records, keyed by (source id, target).
+PERSON_FIELDS = ["name", "start", "end", "start_is_approx", "summary",
+                 "school_of_thought", "region", "quotes", "sources"]
+EVENT_FIELDS = ["name", "start_year", "end_year", "description", "scope",
+                "type", "region", "related_to"]
+INFLUENCE_FIELDS = ["type", "certainty"]
+
+
+@dataclass
+class FieldChange:
+    field: str
+    old: Any
+    new: Any
+
+
+@dataclass
+class RecordChange:
+    id: str
+    name: str
+    changes: List[FieldChange] = field(default_factory=list)
+
+
+@dataclass
+class KindDiff:
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+    modified: List[RecordChange] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.modified)
+
+
+@dataclass
+class DatasetDiff:
+    persons: KindDiff = field(default_factory=KindDiff)
+    events: KindDiff = field(default_factory=KindDiff)
+    influences: KindDiff = field(default_factory=KindDiff)
+    # Keys that occur more than once in either dataset, per kind. Repeats are
+    # diffed by occurrence as "<key>#2", "<key>#3", ...
+    duplicates: Dict[str, List[str]] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return self.persons.is_empty() and self.events.is_empty() and self.influences.is_empty()
+
+    def affected_person_ids(self) -> set:
+        """ Ids of persons whose own record or outgoing influences changed """
+        ids = {p.id for p in self.persons.added + self.persons.removed}
+        ids.update(c.id.split("#", 1)[0] for c in self.persons.modified)
+        for source_id, _target, _inf in self.influences.added + self.influences.removed:
+            ids.add(source_id)
+        for change in self.influences.modified:
+            ids.add(change.id.split("->", 1)[0])
+        return ids
+
+    def affected_event_ids(self) -> set:
+        ids = {e.id for e in self.events.added + self.events.removed}
+        ids.update(c.id.split("#", 1)[0] for c in self.events.modified)
+        return ids
+
+    def to_dict(self) -> dict:
+        def records(kind: KindDiff, as_dict) -> dict:
+            return {
+                "added": [as_dict(r) for r in kind.added],
+                "removed": [as_dict(r) for r in kind.removed],
+                "modified": [
+                    {"id": c.id, "name": c.name,
+                     "changes": [{"field": fc.field, "old": fc.old, "new": fc.new} for fc in c.changes]}
+                    for c in kind.modified
+                ],
+            }
+
+        def influence_dict(entry) -> dict:
+            source_id, target, inf = entry
+            return {"source_id": source_id, "target": target, **inf.__dict__}
+
+        return {
+            "persons": records(self.persons, lambda p: p.to_dict()),
+            "events": records(self.events, lambda e: e.to_dict()),
+            "influences": records(self.influences, influence_dict),
+            "duplicates": self.duplicates,
+        }
+
+
+def _field_changes(old, new, fields: List[str]) -> List[FieldChange]:
+    changes = []
+    for name in fields:
+        old_value = getattr(old, name)
+        new_value = getattr(new, name)
+        if old_value != new_value:
+            changes.append(FieldChange(name, old_value, new_value))
+    return changes
+
+
+def _diff_records(old: Dict[str, Any], new: Dict[str, Any], fields: List[str]) -> KindDiff:
+    result = KindDiff()
+    for key, record in new.items():
+        previous = old.get(key)
+        if previous is None:
+            result.added.append(record)
+            continue
+        changes = _field_changes(previous, record, fields)
+        if changes:
+            result.modified.append(RecordChange(key, getattr(record, "name", key), changes))
+    result.removed = [record for key, record in old.items() if key not in new]
+    return result
+
+
+def _index_by_occurrence(records, key: Callable[[Any], str]) -> Tuple[Dict[str, Any], List[str]]:
+    """ Index records by key; the n-th repeat of a key is stored as "<key>#n" """
+    index = {}
+    seen: Dict[str, int] = {}
+    duplicates = []
+    for record in records:
+        base = key(record)
+        count = seen.get(base, 0) + 1
+        seen[base] = count
+        if count == 2:
+            duplicates.append(base)
+        index[base if count == 1 else f"{base}#{count}"] = record
+    return index, duplicates
+
+
+def _influence_entries(persons: List[Person]):
+    for person in persons:
+        for influence in person.influences:
+            yield person.id, influence.target, influence
+
+
+def _influence_key(entry) -> str:
+    return f"{entry[0]}->{normalize_text(entry[1])}"
+
+
+def _diff_influences(old_index: Dict[str, Tuple[str, str, Any]],
+                     new_index: Dict[str, Tuple[str, str, Any]]) -> KindDiff:
+    result = KindDiff()
+    for key, entry in new_index.items():
+        previous = old_index.get(key)
+        if previous is None:
+            result.added.append(entry)
+            continue
+        changes = _field_changes(previous[2], entry[2], INFLUENCE_FIELDS)
+        if changes:
+            result.modified.append(RecordChange(key, entry[1], changes))
+    result.removed = [entry for key, entry in old_index.items() if key not in new_index]
+    return result
+
+
+def diff_datasets(old_persons: List[Person], old_events: List[Event],
+                  new_persons: List[Person], new_events: List[Event]) -> DatasetDiff:
+    """
+    Compare two datasets by content-derived id in linear time.
+
+    A renamed or re-dated record gets a new id and therefore shows up as
+    one removal plus one addition. Records sharing an id (or influences
+    sharing source and target) are matched by order of occurrence, and the
+    colliding keys are listed in DatasetDiff.duplicates.
+    """
+    by_id = lambda record: record.id
+    old_p, old_p_dups = _index_by_occurrence(old_persons, by_id)
+    new_p, new_p_dups = _index_by_occurrence(new_persons, by_id)
+    old_e, old_e_dups = _index_by_occurrence(old_events, by_id)
+    new_e, new_e_dups = _index_by_occurrence(new_events, by_id)
+    old_i, old_i_dups = _index_by_occurrence(_influence_entries(old_persons), _influence_key)
+    new_i, new_i_dups = _index_by_occurrence(_influence_entries(new_persons), _influence_key)
+
+    duplicates = {
+        "persons": sorted(set(old_p_dups) | set(new_p_dups)),
+        "events": sorted(set(old_e_dups) | set(new_e_dups)),
+        "influences": sorted(set(old_i_dups) | set(new_i_dups)),
+    }
+
+    return DatasetDiff(
+        persons=_diff_records(old_p, new_p, PERSON_FIELDS),
+        events=_diff_records(old_e, new_e, EVENT_FIELDS),
+        influences=_diff_influences(old_i, new_i),
+        duplicates={kind: keys for kind, keys in duplicates.items() if keys},
+    )
@@ -0,0 +1,242 @@
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+from dev.utils.config_loader import resource_path
+
+# Fields whose absence makes from_dict / the dataclass constructor fail.
+# dev/schema.json is an example document and does not mark these itself.
+REQUIRED_FIELDS = {
+    "$": {"persons"},
+    "persons": {"name", "start", "end"},
+    "events": {"name", "start_year"},
+    "influences": {"target"},
+}
+
+# Fields where from_dict accepts null. "(optional)" in the schema string also
+# allows null; 'influences', 'related_to' and 'scope' do not.
+NULLABLE_FIELDS = {
+    "persons": {"id", "start_is_approx", "summary", "school_of_thought", "region", "quotes", "sources"},
+    "events": {"id", "description", "type", "region"},
+    "influences": {"type", "certainty"},
+}
+
+# Keys to_dict writes that the example schema does not list
+EXTRA_FIELDS = {
+    "persons": {"id": "string"},
+    "events": {"id": "string"},
+}
+
+# Unknown keys are errors only where they crash loading (Influence(**inf));
+# from_dict ignores them everywhere else, so there they are warnings.
+STRICT_OBJECTS = {"influences"}
+
+# Record arrays longer than this are split across a process pool unless
+# validate_dataset() is called with workers=1.
+PARALLEL_THRESHOLD = 5000
+
+CIRCA_PATTERN = re.compile(r"^\s*circa\s+-?\d+\s*$", re.IGNORECASE)
+
+
+@dataclass
+class Diagnostic:
+    path: str
+    message: str
+    severity: str = "error"  # "error" or "warning"
+
+    def to_dict(self):
+        return {"path": self.path, "message": self.message, "severity": self.severity}
+
+
+@dataclass
+class ValidationReport:
+    diagnostics: List[Diagnostic] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[Diagnostic]:
+        return [d for d in self.diagnostics if d.severity == "error"]
+
+    @property
+    def warnings(self) -> List[Diagnostic]:
+        return [d for d in self.diagnostics if d.severity == "warning"]
+
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def to_dict(self):
+        return {"valid": self.is_valid(), "diagnostics": [d.to_dict() for d in self.diagnostics]}
+
+    def format(self) -> str:
+        return "\n".join(f"[{d.severity}] {d.path}: {d.message}" for d in self.diagnostics)
+
+
+# A compiled check takes (value, path, out) and appends Diagnostics to out.
+Check = Callable[[Any, str, List[Diagnostic]], None]
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _scalar_check(spec: str) -> Check:
+    """ Compile a type string from dev/schema.json, e.g. "int (optional)" """
+    spec = spec.replace("(optional)", "").strip()
+
+    if "|" in spec:
+        allowed = [s.strip() for s in spec.split("|")]
+
+        def check_enum(value, path, out):
+            if value not in allowed:
+                out.append(Diagnostic(path, f"expected one of {allowed}, got {value!r}"))
+        return check_enum
+
+    if spec == "int or 'circa -###'":
+        def check_year(value, path, out):
+            if _is_int(value):
+                return
+            if isinstance(value, str) and CIRCA_PATTERN.match(value):
+                return
+            out.append(Diagnostic(path, f"expected int or 'circa <year>', got {value!r}"))
+        return check_year
+
+    predicates = {
+        "string": (lambda v: isinstance(v, str), "string"),
+        "int": (_is_int, "int"),
+        "bool": (lambda v: isinstance(v, bool), "bool"),
+    }
+    if spec not in predicates:
+        # Free-form placeholder such as "<date>": accept anything.
+        return lambda value, path, out: None
+    predicate, label = predicates[spec]
+
+    def check_type(value, path, out):
+        if not predicate(value):
+            out.append(Diagnostic(path, f"expected {label}, got {type(value).__name__}"))
+    return check_type
+
+
+def _compile(spec, name: str) -> Check:
+    if isinstance(spec, dict):
+        return _object_check(spec, name)
+    if isinstance(spec, list):
+        return _array_check(_compile(spec[0], name))
+    return _scalar_check(spec)
+
+
+def _array_check(item_check: Check) -> Check:
+    def check_array(value, path, out):
+        if not isinstance(value, list):
+            out.append(Diagnostic(path, f"expected list, got {type(value).__name__}"))
+            return
+        for i, item in enumerate(value):
+            item_check(item, f"{path}[{i}]", out)
+    return check_array
+
+
+def _object_check(spec: dict, name: str) -> Check:
+    spec = {**spec, **EXTRA_FIELDS.get(name, {})}
+    fields = {key: _compile(sub, key) for key, sub in spec.items()}
+    required = REQUIRED_FIELDS.get(name, set())
+    nullable = NULLABLE_FIELDS.get(name, set()) | {
+        key for key, sub in spec.items() if isinstance(sub, str) and "(optional)" in sub
+    }
+    unknown_severity = "error" if name in STRICT_OBJECTS else "warning"
+
+    def check_object(value, path, out):
+        if not isinstance(value, dict):
+            out.append(Diagnostic(path, f"expected object, got {type(value).__name__}"))
+            return
+        for key in sorted(required - value.keys()):
+            out.append(Diagnostic(f"{path}.{key}", "missing required field"))
+        for key, item in value.items():
+            check = fields.get(key)
+            if check is None:
+                out.append(Diagnostic(f"{path}.{key}", "unexpected field", severity=unknown_severity))
+            elif item is None and key in nullable:
+                continue
+            else:
+                check(item, f"{path}.{key}", out)
+    return check_object
+
+
+@lru_cache(maxsize=None)
+def load_schema(path: str = "dev/schema.json") -> dict:
+    with open(resource_path(path), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def compile_schema(path: str = "dev/schema.json") -> Dict[str, Check]:
+    """ Compile the example schema into per-record checks, keyed by section """
+    schema = load_schema(path)
+    checks = {}
+    for key, spec in schema.items():
+        if isinstance(spec, list):
+            checks[key] = _compile(spec[0], key)
+        else:
+            checks[key] = _compile(spec, key)
+    return checks
+
+
+def _validate_chunk(section: str, offset: int, records: list, schema_path: str) -> List[Diagnostic]:
+    check = compile_schema(schema_path)[section]
+    out: List[Diagnostic] = []
+    for i, record in enumerate(records, start=offset):
+        check(record, f"$.{section}[{i}]", out)
+    return out
+
+
+def _validate_section(section: str, records: list, schema_path: str,
+                      workers: Optional[int], chunk_size: int) -> List[Diagnostic]:
+    # Frozen (PyInstaller) entry points must call multiprocessing.freeze_support()
+    # first, or every worker re-launches the app.
+    if workers == 1 or len(records) < PARALLEL_THRESHOLD:
+        return _validate_chunk(section, 0, records, schema_path)
+
+    offsets = range(0, len(records), chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_validate_chunk, section, start,
+                               records[start:start + chunk_size], schema_path)
+                   for start in offsets]
+        diagnostics = []
+        for future in futures:
+            diagnostics.extend(future.result())
+    return diagnostics
+
+
+def validate_dataset(raw: Any, schema_path: str = "dev/schema.json",
+                     workers: Optional[int] = None, chunk_size: int = 2000) -> ValidationReport:
+    """
+    Check every record of a raw timeline document against dev/schema.json
+    and collect all problems instead of stopping at the first one.
+
+    Record arrays above PARALLEL_THRESHOLD are checked in a process pool
+    with `workers` processes (None: one per core); pass workers=1 to stay
+    in the calling process.
+    """
+    report = ValidationReport()
+    if not isinstance(raw, dict):
+        report.diagnostics.append(Diagnostic("$", f"expected object, got {type(raw).__name__}"))
+        return report
+
+    schema = load_schema(schema_path)
+    for key in sorted(REQUIRED_FIELDS["$"] - raw.keys()):
+        report.diagnostics.append(Diagnostic(f"$.{key}", "missing required field"))
+
+    checks = compile_schema(schema_path)
+    for key, value in raw.items():
+        path = f"$.{key}"
+        if key not in schema:
+            report.diagnostics.append(Diagnostic(path, "unexpected field", severity="warning"))
+        elif isinstance(schema[key], list):
+            if not isinstance(value, list):
+                report.diagnostics.append(Diagnostic(path, f"expected list, got {type(value).__name__}"))
+                continue
+            report.diagnostics.extend(_validate_section(key, value, schema_path, workers, chunk_size))
+        else:
+            checks[key](value, path, report.diagnostics)
+
+    return report
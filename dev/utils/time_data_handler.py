@@ -1,6 +1,7 @@
 from dev.core.person import Person
 from dev.core.event import Event
-from typing import List, Set
+from dev.utils.schema_validator import Diagnostic, ValidationReport, validate_dataset
+from typing import List, Optional, Set
 import json
 
 class TimelineDataHandler:
@@ -9,42 +10,60 @@ class TimelineDataHandler:
         self.persons = []
         self.events = []
 
-    def load(self):
+    def load(self, validate: bool = False, workers: Optional[int] = None):
         # Load people
         with open(self.package_path) as f:
             raw = json.load(f)
+
+        if validate:
+            report = validate_dataset(raw, workers=workers)
+            if not report.is_valid():
+                raise ValueError(f"{len(report.errors)} schema error(s) in {self.package_path}:\n{report.format()}")
+
         self.persons = [Person.from_dict(p) for p in raw["persons"]]
         self.events = [Event.from_dict(e) for e in raw.get("events", [])]
 
         return self.persons, self.events
 
-    def validate_context(self):
-        names = set()
-        for person in self.persons:
+    def validate_schema(self, workers: Optional[int] = None) -> ValidationReport:
+        with open(self.package_path) as f:
+            raw = json.load(f)
+        return validate_dataset(raw, workers=workers)
+
+    def validate_context(self) -> ValidationReport:
+        report = ValidationReport()
+        diagnostics = report.diagnostics
+
+        names: Set[str] = set()
+        for i, person in enumerate(self.persons):
             if person.name in names:
-                raise ValueError(f"Duplicate name found: {person.name}")
+                diagnostics.append(Diagnostic(f"$.persons[{i}].name", f"Duplicate name found: {person.name}"))
             names.add(person.name)
 
-        all_names = {p.name for p in self.persons}
-        for person in self.persons:
-            for influencee in person.influenced:
-                if influencee not in all_names:
-                    raise ValueError(f"{person.name} lists unknown influencee: {influencee}")
-
         name_to_person = {p.name: p for p in self.persons}
-        for person in self.persons:
+        for i, person in enumerate(self.persons):
             person_end = person.parsed_end()
-            for influencee in person.influenced:
-                target = name_to_person[influencee]
-                target_start = target.parsed_start()
+            for j, influence in enumerate(person.influences):
+                path = f"$.persons[{i}].influences[{j}].target"
+                target = name_to_person.get(influence.target)
+                if target is None:
+                    diagnostics.append(Diagnostic(path, f"{person.name} lists unknown influencee: {influence.target}",
+                                                  severity="warning"))
+                    continue
 
+                target_start = target.parsed_start()
                 if person_end is None or target_start is None:
-                    print(f"⚠️  Cannot validate dates for {person.name} → {target.name} due to uncertain years.")
+                    diagnostics.append(Diagnostic(path, f"Cannot validate dates for {person.name} → {target.name} "
+                                                        f"due to uncertain years.", severity="warning"))
                     continue
 
                 gap = target_start - person_end
                 if gap > 0:
-                    print(f"⚠️  Note: {person.name} died {gap} years before {target.name} was born.")
+                    diagnostics.append(Diagnostic(path, f"{person.name} died {gap} years before {target.name} was born.",
+                                                  severity="warning"))
                 elif gap < -20:
-                    print(f"⚠️  Note: {person.name} still alive {abs(gap)} years after {target.name} was born — "
-                        f"consider rechecking chronology.")
+                    diagnostics.append(Diagnostic(path, f"{person.name} still alive {abs(gap)} years after "
+                                                        f"{target.name} was born — consider rechecking chronology.",
+                                                  severity="warning"))
+
+        return report
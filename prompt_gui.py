@@ -1,3 +1,4 @@
+import multiprocessing
 import tkinter as tk
 from tkinter import messagebox, filedialog, ttk
 from dev.prompt_generator.promt_generator import PromptGenerator, load_data
@@ -142,6 +143,8 @@ class PromptApp:
 
 
 if __name__ == "__main__":
+    # Required in the frozen build before the validator starts worker processes
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = PromptApp(root)
     root.mainloop()